@@ -43,3 +43,44 @@ def test_system_metrics_endpoint(flask_test_client):
     response = flask_test_client.get('/api/system_metrics')
     assert response.status_code == 200
     assert isinstance(response.get_json(), dict)
+
+def test_json_provider_serializes_numpy(flask_test_client):
+    if flask_test_client is None:
+        pytest.skip("Flask app not available")
+    
+    import numpy as np
+    app = flask_test_client.application
+    with app.app_context():
+        encoded = app.json.dumps({'score': np.float32(0.5), 'values': np.arange(3)})
+    assert app.json.loads(encoded) == {'score': 0.5, 'values': [0, 1, 2]}
+
+def test_dashboard_data_etag(flask_test_client):
+    if flask_test_client is None:
+        pytest.skip("Flask app not available")
+    
+    response = flask_test_client.get('/api/dashboard_data')
+    etag = response.headers.get('ETag')
+    assert etag
+    
+    cached = flask_test_client.get('/api/dashboard_data', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+
+def test_alerts_newest_first(flask_test_client):
+    if flask_test_client is None:
+        pytest.skip("Flask app not available")
+    
+    response = flask_test_client.get('/api/alerts?limit=5')
+    timestamps = [alert['timestamp'] for alert in response.get_json()]
+    assert len(timestamps) <= 5
+    assert timestamps == sorted(timestamps, reverse=True)
+
+def test_dashboard_data_gzip(flask_test_client):
+    if flask_test_client is None:
+        pytest.skip("Flask app not available")
+    
+    import gzip
+    import json
+    response = flask_test_client.get('/api/dashboard_data', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers.get('Content-Encoding') == 'gzip'
+    assert isinstance(json.loads(gzip.decompress(response.data)), dict)
@@ -4,29 +4,45 @@ Enhanced Flask Application for Digital Twin System v2.0
 Main web application with real-time capabilities, advanced analytics, and secure API endpoints.
 """
 
+# Make sockets, sleeps and locks cooperative when run as a script; this must
+# run before any other import (gunicorn's eventlet worker patches on its own)
+if __name__ == '__main__':
+    import eventlet
+    eventlet.monkey_patch()
+
 import os
 import sys
 import json
 import logging
+import logging.handlers
+import queue
+import atexit
 import sqlite3
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import threading
 import time
+import random
 import uuid
+from collections import deque
+from itertools import islice
 from functools import wraps
 import hashlib
 import hmac
 import secrets
+import gzip
+import brotli
+import orjson
 
 # Flask imports
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash
+from flask import Flask, Response, render_template, request, jsonify, session, redirect, url_for, flash
+from flask import json as flask_json
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
 from flask_socketio import SocketIO, emit, join_room, leave_room, disconnect
-import eventlet
 
 # Security imports
 import jwt
@@ -48,9 +64,139 @@ except ImportError as e:
     print(f"Warning: Could not import some modules: {e}")
     print("Some features may not be available")
 
+# Fallback secret key, generated once per process
+_DEFAULT_SECRET = secrets.token_hex(32)
+
+# Native datetime/UUID/numpy support, so payloads need no per-field conversion
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string"""
+        option = ORJSON_OPTIONS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes"""
+        return orjson.loads(s)
+
+# Static per-type device attributes
+UNIT_BY_TYPE = {
+    'temperature_sensor': '°C',
+    'pressure_sensor': 'hPa',
+    'vibration_sensor': 'mm/s',
+    'humidity_sensor': '%RH',
+    'power_meter': 'W'
+}
+DISPLAY_NAME_BY_TYPE = {device_type: device_type.replace('_', ' ').title() for device_type in UNIT_BY_TYPE}
+
+class SampleDeviceFleet:
+    """Simulated device fleet held as parallel arrays, one entry per device"""
+    
+    __slots__ = ('rng', 'device_ids', 'device_names', 'device_types', 'units', 'base_values',
+                 'values', 'statuses', 'health_scores', 'efficiency_scores', 'locations', 'timestamp')
+    
+    DEVICE_TYPES = ['temperature_sensor', 'pressure_sensor', 'vibration_sensor', 'humidity_sensor']
+    LOCATIONS = ['Factory Floor A', 'Factory Floor B', 'Warehouse', 'Quality Lab']
+    
+    def __init__(self, rng, count=15):
+        self.rng = rng
+        
+        # Draw every field for all devices at once
+        types = rng.choice(self.DEVICE_TYPES, count)
+        self.device_types = types.tolist()
+        self.device_ids = [f'DEVICE_{i+1:03d}' for i in range(count)]
+        self.device_names = [f'{DISPLAY_NAME_BY_TYPE[device_type]} {i+1:03d}'
+                             for i, device_type in enumerate(self.device_types)]
+        self.units = [UNIT_BY_TYPE[device_type] for device_type in self.device_types]
+        self.base_values = rng.uniform(10, 100, count)
+        self.values = self.base_values.copy()
+        self.statuses = self.draw_statuses(count)
+        self.health_scores = self.draw_health_scores(self.statuses)
+        self.efficiency_scores = rng.uniform(0.7, 1.0, count)
+        self.locations = rng.choice(self.LOCATIONS, count).tolist()
+        self.timestamp = datetime.now().isoformat()
+    
+    def update(self):
+        """Advance the fleet by one tick of random variation"""
+        count = len(self.values)
+        
+        # Vary each reading by up to +/-10% around its base value
+        self.values = self.base_values * (1 + self.rng.uniform(-0.1, 0.1, count))
+        
+        # Occasionally change device status
+        flip_mask = self.rng.random(count) < 0.05
+        flips = int(flip_mask.sum())
+        if flips:
+            new_statuses = self.draw_statuses(flips)
+            self.statuses[flip_mask] = new_statuses
+            self.health_scores[flip_mask] = self.draw_health_scores(new_statuses)
+        
+        self.timestamp = datetime.now().isoformat()
+    
+    def draw_statuses(self, count):
+        """Draw device statuses: 90% normal, 5% warning, 5% critical"""
+        status_prob = self.rng.random(count)
+        return np.where(status_prob > 0.1, 'normal',
+                        np.where(status_prob > 0.05, 'warning', 'critical'))
+    
+    def draw_health_scores(self, statuses):
+        """Draw health scores within the range matching each status"""
+        is_normal = statuses == 'normal'
+        is_warning = statuses == 'warning'
+        health_low = np.select([is_normal, is_warning], [0.8, 0.5], 0.1)
+        health_high = np.select([is_normal, is_warning], [1.0, 0.8], 0.5)
+        return self.rng.uniform(health_low, health_high)
+    
+    def to_records(self):
+        """Materialize the fleet as one dict per device"""
+        return [
+            {
+                'device_id': device_id,
+                'device_name': device_name,
+                'device_type': device_type,
+                'value': value,
+                'unit': unit,
+                'status': status,
+                'health_score': health_score,
+                'efficiency_score': efficiency_score,
+                'location': location,
+                'timestamp': self.timestamp
+            }
+            for device_id, device_name, device_type, unit, value, status, health_score, efficiency_score, location in zip(
+                self.device_ids, self.device_names, self.device_types, self.units,
+                self.values.round(2).tolist(), self.statuses.tolist(), self.health_scores.tolist(),
+                self.efficiency_scores.tolist(), self.locations
+            )
+        ]
+
 class DigitalTwinApp:
     """Main Digital Twin Flask Application Class"""
     
+    # Sample alert (title, severity) pairs for the alerts API
+    ALERT_TYPES = [
+        ('Temperature anomaly detected', 'warning'),
+        ('Pressure threshold exceeded', 'critical'),
+        ('Device offline', 'critical'),
+        ('Vibration levels high', 'warning'),
+        ('Maintenance required', 'info'),
+        ('System performance degraded', 'warning')
+    ]
+    
+    # Daily pattern factor for each hour of the day
+    HOUR_FACTOR_BY_HOUR = np.sin(2 * np.pi * np.arange(24) / 24)
+    
+    # Alert (title, severity) pairs raised by the background task
+    LIVE_ALERT_TYPES = [
+        ('Temperature spike detected', 'warning'),
+        ('Pressure anomaly', 'critical'),
+        ('Vibration threshold exceeded', 'warning')
+    ]
+    
     def __init__(self):
         self.app = None
         self.socketio = None
@@ -64,7 +210,21 @@ class DigitalTwinApp:
         # Application state
         self.connected_clients = {}
         self.data_cache = {}
+        self.cache_lock = threading.Lock()
         self.last_update = datetime.now()
+        # numpy Generator for batched draws, stdlib Random for scalar draws
+        self.np_rng = np.random.default_rng()
+        self.py_rng = random.Random()
+        self.sample_fleet = None
+        self.labels_cache = (None, None)
+        
+        # Sample device ids and precomputed alert (title, severity, device_id, message) tuples
+        self.device_ids = [f'DEVICE_{i:03d}' for i in range(1, 16)]
+        self.alert_templates = [
+            (title, severity, self.device_ids[i % 5], f'{title} on device {self.device_ids[i % 5]}')
+            for i, (title, severity) in enumerate(self.ALERT_TYPES)
+        ]
+        self.sample_alerts = deque(self.generate_sample_alerts(), maxlen=50)
         
         # Initialize logging
         self.setup_logging()
@@ -86,34 +246,54 @@ class DigitalTwinApp:
     
     def setup_logging(self):
         """Setup comprehensive logging system"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
+        # Install handlers once per process; the file and console writes happen
+        # on a listener thread so request handlers never block on log I/O
+        if not logging.getLogger().handlers:
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            output_handlers = [
                 logging.FileHandler('LOGS/digital_twin_app.log'),
                 logging.StreamHandler()
             ]
-        )
+            for handler in output_handlers:
+                handler.setFormatter(formatter)
+            
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(log_queue, *output_handlers)
+            listener.start()
+            atexit.register(listener.stop)
+            
+            # Output handlers apply the full format, so queue only the message
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.setFormatter(logging.Formatter('%(message)s'))
+            logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+        
         self.logger = logging.getLogger('DigitalTwinApp')
         self.logger.info("Digital Twin Application starting...")
     
     def create_app(self):
         """Create and configure Flask application"""
         self.app = Flask(__name__)
+        self.app.json = OrjsonProvider(self.app)
         
         # Configuration
-        self.app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', secrets.token_hex(32))
+        self.app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY') or _DEFAULT_SECRET
         self.app.config['DEBUG'] = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
         self.app.config['TESTING'] = False
         
         # CORS configuration
         CORS(self.app, origins="*", allow_headers=["Content-Type", "Authorization"])
         
+        # Response compression
+        self.app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+        self.app.config['COMPRESS_MIN_SIZE'] = 500
+        Compress(self.app)
+        
         # SocketIO initialization
         self.socketio = SocketIO(
             self.app,
             cors_allowed_origins="*",
             async_mode='eventlet',
+            json=flask_json,
             logger=False,
             engineio_logger=False,
             ping_timeout=60,
@@ -211,8 +391,8 @@ class DigitalTwinApp:
         def get_dashboard_data():
             """Get main dashboard data"""
             try:
-                data = self.get_cached_dashboard_data()
-                return jsonify(data)
+                self.get_cached_dashboard_data()
+                return self.cached_json_response('dashboard')
             except Exception as e:
                 self.logger.error(f"Error getting dashboard data: {e}")
                 return jsonify({'error': str(e)}), 500
@@ -244,8 +424,8 @@ class DigitalTwinApp:
         def get_analytics_data():
             """Get analytics data for charts"""
             try:
-                analytics_data = self.get_analytics_data()
-                return jsonify(analytics_data)
+                self.get_cached_analytics_data()
+                return self.cached_json_response('analytics')
             except Exception as e:
                 self.logger.error(f"Error getting analytics data: {e}")
                 return jsonify({'error': str(e)}), 500
@@ -344,9 +524,10 @@ class DigitalTwinApp:
             """Handle client connection"""
             client_id = str(uuid.uuid4())
             session['client_id'] = client_id
+            now = datetime.now()
             self.connected_clients[client_id] = {
-                'connected_at': datetime.now(),
-                'last_ping': datetime.now()
+                'connected_at': now,
+                'last_ping': now
             }
             
             self.logger.info(f"Client {client_id} connected. Total clients: {len(self.connected_clients)}")
@@ -367,8 +548,9 @@ class DigitalTwinApp:
             """Handle client ping"""
             client_id = session.get('client_id')
             if client_id and client_id in self.connected_clients:
-                self.connected_clients[client_id]['last_ping'] = datetime.now()
-                emit('pong', {'timestamp': datetime.now().isoformat()})
+                now = datetime.now()
+                self.connected_clients[client_id]['last_ping'] = now
+                emit('pong', {'timestamp': now.isoformat()})
         
         @self.socketio.on('subscribe')
         def handle_subscribe(data):
@@ -411,11 +593,11 @@ class DigitalTwinApp:
                     # Check for new alerts
                     self.check_and_send_alerts()
                     
-                    eventlet.sleep(30)  # Update every 30 seconds
+                    self.socketio.sleep(30)  # Update every 30 seconds
                     
                 except Exception as e:
                     self.logger.error(f"Error in data update task: {e}")
-                    eventlet.sleep(60)  # Wait longer on error
+                    self.socketio.sleep(60)  # Wait longer on error
         
         def cleanup_task():
             """Background task to cleanup disconnected clients"""
@@ -433,11 +615,11 @@ class DigitalTwinApp:
                         del self.connected_clients[client_id]
                         self.logger.info(f"Cleaned up inactive client {client_id}")
                     
-                    eventlet.sleep(300)  # Cleanup every 5 minutes
+                    self.socketio.sleep(300)  # Cleanup every 5 minutes
                     
                 except Exception as e:
                     self.logger.error(f"Error in cleanup task: {e}")
-                    eventlet.sleep(600)  # Wait longer on error
+                    self.socketio.sleep(600)  # Wait longer on error
         
         # Start background tasks
         self.socketio.start_background_task(data_update_task)
@@ -446,14 +628,62 @@ class DigitalTwinApp:
         self.logger.info("Background tasks started")
     
     # Data retrieval methods
+    def get_cached_data(self, key, fetch_func, max_age=60):
+        """Get cached data, refreshing it with fetch_func once it is older than max_age seconds"""
+        if self.is_cache_fresh(key, max_age):
+            return self.data_cache[key]
+        
+        # Only one thread refreshes; the others wait and then reuse its result
+        with self.cache_lock:
+            if not self.is_cache_fresh(key, max_age):
+                self.set_cache_entry(key, fetch_func())
+        
+        return self.data_cache[key]
+    
+    def is_cache_fresh(self, key, max_age):
+        """Check whether a cache entry was refreshed within max_age seconds"""
+        refreshed = self.data_cache.get(f'{key}_refreshed')
+        return refreshed is not None and time.monotonic() - refreshed <= max_age
+    
+    def set_cache_entry(self, key, data):
+        """Store data in the cache together with its encoded JSON body and ETag"""
+        refreshed = time.monotonic()
+        body = orjson.dumps(data, option=ORJSON_OPTIONS)
+        compressed = {
+            'br': brotli.compress(body),
+            'gzip': gzip.compress(body)
+        }
+        
+        # Freshness stamp is written last so readers never see it ahead of the data
+        self.data_cache[key] = data
+        self.data_cache[f'{key}_encoded'] = (body, compressed, f'{key}-{refreshed:.6f}')
+        self.data_cache[f'{key}_refreshed'] = refreshed
+    
+    def cached_json_response(self, key):
+        """Serve a cache entry's pre-encoded body, answering 304 when the ETag matches"""
+        body, compressed, etag = self.data_cache[f'{key}_encoded']
+        encoding = request.accept_encodings.best_match(self.app.config['COMPRESS_ALGORITHM'])
+        
+        if encoding in compressed:
+            response = Response(compressed[encoding], mimetype='application/json')
+            response.headers['Content-Encoding'] = encoding
+            response.set_etag(f'{etag}-{encoding}')
+        else:
+            response = Response(body, mimetype='application/json')
+            response.set_etag(etag)
+        
+        # Both branches depend on the request's Accept-Encoding
+        response.headers['Vary'] = 'Accept-Encoding'
+        
+        return response.make_conditional(request)
+    
     def get_cached_dashboard_data(self):
         """Get cached dashboard data"""
-        if 'dashboard' not in self.data_cache or \
-           datetime.now() - self.data_cache.get('dashboard_updated', datetime.min) > timedelta(minutes=1):
-            self.data_cache['dashboard'] = self.fetch_dashboard_data()
-            self.data_cache['dashboard_updated'] = datetime.now()
-        
-        return self.data_cache['dashboard']
+        return self.get_cached_data('dashboard', self.fetch_dashboard_data)
+    
+    def get_cached_analytics_data(self):
+        """Get cached analytics data"""
+        return self.get_cached_data('analytics', self.get_analytics_data)
     
     def fetch_dashboard_data(self):
         """Fetch fresh dashboard data"""
@@ -461,17 +691,10 @@ class DigitalTwinApp:
             # Get latest device data
             devices_data = self.get_latest_device_data()
             
-            # Calculate key metrics
+            # Calculate key metrics and status distribution in one pass
             total_devices = len(devices_data)
-            active_devices = len([d for d in devices_data if d.get('status') == 'normal'])
-            
-            # Calculate average health score
-            health_scores = [d.get('health_score', 0) for d in devices_data if d.get('health_score')]
-            avg_health = np.mean(health_scores) * 100 if health_scores else 0
-            
-            # Calculate average efficiency
-            efficiency_scores = [d.get('efficiency_score', 0) for d in devices_data if d.get('efficiency_score')]
-            avg_efficiency = np.mean(efficiency_scores) * 100 if efficiency_scores else 0
+            status_distribution, avg_health, avg_efficiency = self.summarize_devices(devices_data)
+            active_devices = status_distribution['normal']
             
             # Get energy usage
             energy_usage = self.get_current_energy_usage()
@@ -479,9 +702,6 @@ class DigitalTwinApp:
             # Get performance data for charts
             performance_data = self.get_performance_chart_data()
             
-            # Get status distribution
-            status_distribution = self.calculate_status_distribution(devices_data)
-            
             return {
                 'timestamp': datetime.now().isoformat(),
                 'system_health': avg_health,
@@ -520,8 +740,8 @@ class DigitalTwinApp:
                     ORDER BY device_id
                 """
                 
-                df = pd.read_sql_query(query, conn)
-                return df.to_dict('records')
+                conn.row_factory = sqlite3.Row
+                return [dict(row) for row in conn.execute(query)]
                 
         except Exception as e:
             self.logger.error(f"Error getting device data: {e}")
@@ -529,49 +749,10 @@ class DigitalTwinApp:
     
     def generate_sample_device_data(self):
         """Generate sample device data for demo purposes"""
-        devices = []
-        device_types = ['temperature_sensor', 'pressure_sensor', 'vibration_sensor', 'humidity_sensor']
-        locations = ['Factory Floor A', 'Factory Floor B', 'Warehouse', 'Quality Lab']
-        
-        for i in range(15):
-            device_type = np.random.choice(device_types)
-            status_prob = np.random.random()
-            
-            if status_prob > 0.1:
-                status = 'normal'
-                health_score = np.random.uniform(0.8, 1.0)
-            elif status_prob > 0.05:
-                status = 'warning'
-                health_score = np.random.uniform(0.5, 0.8)
-            else:
-                status = 'critical'
-                health_score = np.random.uniform(0.1, 0.5)
-            
-            devices.append({
-                'device_id': f'DEVICE_{i+1:03d}',
-                'device_name': f'{device_type.replace("_", " ").title()} {i+1:03d}',
-                'device_type': device_type,
-                'value': round(np.random.uniform(10, 100), 2),
-                'unit': self.get_unit_for_type(device_type),
-                'status': status,
-                'health_score': health_score,
-                'efficiency_score': np.random.uniform(0.7, 1.0),
-                'location': np.random.choice(locations),
-                'timestamp': datetime.now().isoformat()
-            })
+        if self.sample_fleet is None:
+            self.sample_fleet = SampleDeviceFleet(self.np_rng)
         
-        return devices
-    
-    def get_unit_for_type(self, device_type):
-        """Get appropriate unit for device type"""
-        units = {
-            'temperature_sensor': '°C',
-            'pressure_sensor': 'hPa',
-            'vibration_sensor': 'mm/s',
-            'humidity_sensor': '%RH',
-            'power_meter': 'W'
-        }
-        return units.get(device_type, 'units')
+        return self.sample_fleet.to_records()
     
     def get_current_energy_usage(self):
         """Get current energy usage"""
@@ -584,49 +765,53 @@ class DigitalTwinApp:
                     ORDER BY timestamp DESC 
                     LIMIT 1
                 """
-                result = pd.read_sql_query(query, conn)
-                if not result.empty:
-                    return float(result.iloc[0]['power_consumption_kw'])
+                row = conn.execute(query).fetchone()
+                if row is not None:
+                    return float(row[0])
         except:
             pass
         
         # Return sample data if database not available
-        return round(np.random.uniform(800, 1500), 1)
+        return round(self.py_rng.uniform(800, 1500), 1)
     
     def get_performance_chart_data(self):
         """Get data for performance charts"""
         try:
             # Generate last 24 hours of data points
             now = datetime.now()
-            timestamps = []
-            health_scores = []
-            efficiency_scores = []
+            timestamps = self.get_hourly_labels(now)
             
-            for i in range(24):
-                timestamp = now - timedelta(hours=23-i)
-                timestamps.append(timestamp.strftime('%H:%M'))
-                
-                # Simulate daily patterns
-                hour_factor = np.sin(2 * np.pi * timestamp.hour / 24)
-                base_health = 85 + 10 * hour_factor + np.random.normal(0, 3)
-                base_efficiency = 78 + 12 * hour_factor + np.random.normal(0, 4)
-                
-                health_scores.append(max(0, min(100, base_health)))
-                efficiency_scores.append(max(0, min(100, base_efficiency)))
+            # Simulate daily patterns
+            hours = (now.hour - np.arange(23, -1, -1)) % 24
+            hour_factor = self.HOUR_FACTOR_BY_HOUR[hours]
+            health_scores = np.clip(85 + 10 * hour_factor + self.np_rng.normal(0, 3, 24), 0, 100)
+            efficiency_scores = np.clip(78 + 12 * hour_factor + self.np_rng.normal(0, 4, 24), 0, 100)
             
+            # Scores stay as float32 arrays; orjson serializes ndarrays directly
             return {
                 'labels': timestamps,
-                'health_scores': health_scores,
-                'efficiency_scores': efficiency_scores
+                'health_scores': health_scores.astype(np.float32),
+                'efficiency_scores': efficiency_scores.astype(np.float32)
             }
             
         except Exception as e:
             self.logger.error(f"Error getting performance chart data: {e}")
             return {'labels': [], 'health_scores': [], 'efficiency_scores': []}
     
-    def calculate_status_distribution(self, devices_data):
-        """Calculate device status distribution"""
+    def get_hourly_labels(self, now):
+        """Get HH:MM labels for the 24 hours ending at now, cached per minute"""
+        key = now.replace(second=0, microsecond=0)
+        if self.labels_cache[0] != key:
+            labels = [f'{(now.hour - i) % 24:02d}:{now.minute:02d}' for i in range(23, -1, -1)]
+            self.labels_cache = (key, labels)
+        
+        return self.labels_cache[1]
+    
+    def summarize_devices(self, devices_data):
+        """Calculate status distribution and average health/efficiency (as percentages)"""
         status_counts = {'normal': 0, 'warning': 0, 'critical': 0}
+        health_total = health_count = 0
+        efficiency_total = efficiency_count = 0
         
         for device in devices_data:
             status = device.get('status', 'normal')
@@ -634,8 +819,21 @@ class DigitalTwinApp:
                 status_counts[status] += 1
             elif status == 'anomaly':
                 status_counts['critical'] += 1
+            
+            health_score = device.get('health_score')
+            if health_score:
+                health_total += health_score
+                health_count += 1
+            
+            efficiency_score = device.get('efficiency_score')
+            if efficiency_score:
+                efficiency_total += efficiency_score
+                efficiency_count += 1
+        
+        avg_health = health_total / health_count * 100 if health_count else 0
+        avg_efficiency = efficiency_total / efficiency_count * 100 if efficiency_count else 0
         
-        return status_counts
+        return status_counts, avg_health, avg_efficiency
     
     def get_devices_data(self):
         """Get detailed devices data"""
@@ -654,25 +852,30 @@ class DigitalTwinApp:
         try:
             # Generate sample analytics data
             now = datetime.now()
-            timestamps = [(now - timedelta(hours=i)).strftime('%H:%M') for i in range(23, -1, -1)]
+            timestamps = self.get_hourly_labels(now)
+            
+            # Compute all sensor patterns as one (sensors x 24) batch
+            sensors = ['temperature', 'pressure', 'vibration', 'power']
+            base = np.array([20, 1013, 0.2, 1200])[:, None]
+            amplitude = np.array([5, 20, 0.1, 300])[:, None]
+            frequency = np.array([0.1, 0.05, 0.15, 0.08])[:, None]
+            
+            # Gaussian noise for most sensors, exponential for vibration
+            hours = np.arange(24)
+            noise = np.vstack([
+                self.np_rng.normal(0, 1, 24),
+                self.np_rng.normal(0, 5, 24),
+                self.np_rng.exponential(0.05, 24),
+                self.np_rng.normal(0, 50, 24)
+            ])
+            values = base + amplitude * np.sin(hours * frequency) + noise
             
             analytics = {
-                'temperature': {
-                    'labels': timestamps,
-                    'values': [20 + 5*np.sin(i*0.1) + np.random.normal(0, 1) for i in range(24)]
-                },
-                'pressure': {
-                    'labels': timestamps,
-                    'values': [1013 + 20*np.sin(i*0.05) + np.random.normal(0, 5) for i in range(24)]
-                },
-                'vibration': {
-                    'labels': timestamps,
-                    'values': [0.2 + 0.1*np.sin(i*0.15) + np.random.exponential(0.05) for i in range(24)]
-                },
-                'power': {
+                sensor: {
                     'labels': timestamps,
-                    'values': [1200 + 300*np.sin(i*0.08) + np.random.normal(0, 50) for i in range(24)]
+                    'values': sensor_values
                 }
+                for sensor, sensor_values in zip(sensors, values.tolist())
             }
             
             return analytics
@@ -684,38 +887,32 @@ class DigitalTwinApp:
     def get_alerts_data(self, limit=10, severity=None):
         """Get system alerts"""
         try:
-            # Generate sample alerts
-            alert_types = [
-                ('Temperature anomaly detected', 'warning'),
-                ('Pressure threshold exceeded', 'critical'),
-                ('Device offline', 'critical'),
-                ('Vibration levels high', 'warning'),
-                ('Maintenance required', 'info'),
-                ('System performance degraded', 'warning')
-            ]
-            
-            alerts = []
-            for i in range(min(limit, len(alert_types))):
-                alert_type, alert_severity = alert_types[i % len(alert_types)]
-                
-                if severity and alert_severity != severity:
-                    continue
-                
-                alerts.append({
-                    'id': str(uuid.uuid4()),
-                    'title': alert_type,
-                    'message': f'{alert_type} on device DEVICE_{(i%5)+1:03d}',
-                    'severity': alert_severity,
-                    'device_id': f'DEVICE_{(i%5)+1:03d}',
-                    'timestamp': (datetime.now() - timedelta(minutes=i*15)).isoformat()
-                })
-            
-            return alerts
+            # Alerts are kept newest first, so no sorting is needed
+            alerts = (alert for alert in self.sample_alerts
+                      if not severity or alert['severity'] == severity)
+            return list(islice(alerts, max(limit, 0)))
             
         except Exception as e:
             self.logger.error(f"Error getting alerts: {e}")
             return []
     
+    def generate_sample_alerts(self):
+        """Generate sample alerts, newest first"""
+        now = datetime.now()
+        
+        # Each template is 15 minutes older than the previous one
+        return [
+            {
+                'id': str(uuid.uuid4()),
+                'title': alert_type,
+                'message': message,
+                'severity': alert_severity,
+                'device_id': device_id,
+                'timestamp': (now - timedelta(minutes=i*15)).isoformat()
+            }
+            for i, (alert_type, alert_severity, device_id, message) in enumerate(self.alert_templates)
+        ]
+    
     def get_system_metrics(self):
         """Get system performance metrics"""
         try:
@@ -734,9 +931,9 @@ class DigitalTwinApp:
             # Fallback if psutil is not available
             return {
                 'timestamp': datetime.now().isoformat(),
-                'cpu_percent': np.random.uniform(20, 80),
-                'memory_percent': np.random.uniform(40, 70),
-                'disk_percent': np.random.uniform(50, 85),
+                'cpu_percent': self.py_rng.uniform(20, 80),
+                'memory_percent': self.py_rng.uniform(40, 70),
+                'disk_percent': self.py_rng.uniform(50, 85),
                 'active_connections': len(self.connected_clients)
             }
         except Exception as e:
@@ -756,7 +953,7 @@ class DigitalTwinApp:
                 timestamps.append(timestamp.isoformat())
                 
                 # Generate realistic historical pattern
-                value = 50 + 20*np.sin(i*0.1) + np.random.normal(0, 5)
+                value = 50 + 20*np.sin(i*0.1) + self.py_rng.gauss(0, 5)
                 values.append(round(value, 2))
             
             return {
@@ -784,7 +981,7 @@ class DigitalTwinApp:
                 timestamps.append(timestamp.isoformat())
                 
                 # Generate prediction with decreasing confidence
-                pred = 50 + 15*np.sin(i*0.05) + np.random.normal(0, 2)
+                pred = 50 + 15*np.sin(i*0.05) + self.py_rng.gauss(0, 2)
                 conf = max(0.5, 0.95 - (i * 0.02))  # Decreasing confidence
                 
                 predictions.append(round(pred, 2))
@@ -814,10 +1011,10 @@ class DigitalTwinApp:
                 health_scores[device_id] = {
                     'overall_health': health_score * 100,
                     'components': {
-                        'performance': np.random.uniform(0.7, 1.0) * 100,
-                        'reliability': np.random.uniform(0.8, 1.0) * 100,
+                        'performance': self.py_rng.uniform(0.7, 1.0) * 100,
+                        'reliability': self.py_rng.uniform(0.8, 1.0) * 100,
                         'efficiency': device.get('efficiency_score', 0.8) * 100,
-                        'maintenance': np.random.uniform(0.6, 0.9) * 100
+                        'maintenance': self.py_rng.uniform(0.6, 0.9) * 100
                     }
                 }
             
@@ -875,7 +1072,7 @@ class DigitalTwinApp:
             
             export_data = {
                 'metadata': {
-                    'export_timestamp': datetime.now().isoformat(),
+                    'export_timestamp': end_date.isoformat(),
                     'date_range': {
                         'start': start_date.isoformat(),
                         'end': end_date.isoformat()
@@ -896,15 +1093,19 @@ class DigitalTwinApp:
     def update_data_cache(self):
         """Update cached data"""
         try:
+            # Advance the sample fleet once per tick
+            if self.sample_fleet is not None:
+                self.sample_fleet.update()
+            
             # Update dashboard data
-            self.data_cache['dashboard'] = self.fetch_dashboard_data()
-            self.data_cache['dashboard_updated'] = datetime.now()
+            self.set_cache_entry('dashboard', self.fetch_dashboard_data())
             
             # Update other cached data
             self.data_cache['devices'] = self.get_latest_device_data()
-            self.data_cache['devices_updated'] = datetime.now()
+            now = datetime.now()
+            self.data_cache['devices_updated'] = now
             
-            self.last_update = datetime.now()
+            self.last_update = now
             
         except Exception as e:
             self.logger.error(f"Error updating data cache: {e}")
@@ -913,15 +1114,9 @@ class DigitalTwinApp:
         """Check for new alerts and send to clients"""
         try:
             # Simulate alert generation
-            if np.random.random() < 0.1:  # 10% chance of new alert
-                alert_types = [
-                    ('Temperature spike detected', 'warning'),
-                    ('Pressure anomaly', 'critical'),
-                    ('Vibration threshold exceeded', 'warning')
-                ]
-                
-                alert_type, severity = np.random.choice(alert_types)
-                device_id = f'DEVICE_{np.random.randint(1, 16):03d}'
+            if self.py_rng.random() < 0.1:  # 10% chance of new alert
+                alert_type, severity = self.py_rng.choice(self.LIVE_ALERT_TYPES)
+                device_id = self.py_rng.choice(self.device_ids)
                 
                 new_alert = {
                     'id': str(uuid.uuid4()),
@@ -932,6 +1127,9 @@ class DigitalTwinApp:
                     'timestamp': datetime.now().isoformat()
                 }
                 
+                # Newest alert goes first; the deque drops the oldest past 50
+                self.sample_alerts.appendleft(new_alert)
+                
                 # Send to subscribed clients
                 self.socketio.emit('alert_update', new_alert, room='alerts')
                 self.logger.info(f"New alert sent: {alert_type} - {device_id}")
@@ -1025,6 +1223,10 @@ def create_app():
         logging.error(f"Failed to create application: {e}")
         raise
 
+def create_wsgi_app():
+    """WSGI factory for gunicorn, e.g. gunicorn -k eventlet -w 1 'module:create_wsgi_app()'"""
+    return create_app().app
+
 # Main execution
 if __name__ == '__main__':
     # Setup environment